@@ -10,7 +10,8 @@
 # ]
 # ///
 """
-Unit tests for datetime filter normalization and exception classification.
+Unit tests for datetime filter normalization, exception classification and
+the server's internal helpers.
 
 Validates that _normalize_datetime_filter correctly transforms common LLM
 datetime inputs (date-only, ISO-8601, range syntax) into ZenML's required
@@ -21,17 +22,89 @@ Usage:
     uv run scripts/test_datetime_normalization.py
 """
 
+import io
+import os
 import sys
+import time
+from collections.abc import Callable
+from contextlib import redirect_stderr
+from datetime import datetime
 from pathlib import Path
+from threading import Event, Thread
+from types import SimpleNamespace
+from typing import Any
+
+import requests
+from pydantic import BaseModel
+from zenml.models import Page
 
 # Add server directory to path so we can import zenml_server
 sys.path.insert(0, str(Path(__file__).parent.parent / "server"))
 
+import zenml_server
 from zenml_server import (
+    _FETCH_ALL_MAX_PAGES,
+    _access_tokens,
+    _apply_list_cursor,
+    _clamp_pagination,
     _classify_exception,
+    _clear_prefetched_pages,
+    _compact_tool_result,
+    _decode_list_cursor,
+    _dump_page,
+    _fetch_all_pages,
+    _log_tool_error,
+    _lookup_cache,
+    _memoize_lookup,
     _normalize_datetime_filter,
+    _normalize_logical_operator,
+    _normalize_sort_by,
+    _PaginationLimitError,
+    _prefetch_in_flight,
+    _prefetch_page,
+    _prefetched_pages,
+    _project_fields,
+    _recent_error_logs,
+    _TTLCache,
+    get_many,
+    get_step_logs,
+    list_all_pipeline_runs,
 )
 
+
+class _Checks:
+    """Pass/fail tally for one group of checks, in the (passed, failed,
+    failure_messages) shape every test function returns."""
+
+    def __init__(self) -> None:
+        self.passed = 0
+        self.failed = 0
+        self.failures: list[str] = []
+
+    def check(self, desc: str, actual: object, expected: object) -> None:
+        if actual == expected:
+            self.passed += 1
+        else:
+            self.failed += 1
+            self.failures.append(
+                f"  FAIL: {desc}\n    expected: {expected!r}\n    actual:   {actual!r}"
+            )
+
+    def raises(
+        self, desc: str, exc_type: type[BaseException], func: Callable[[], object]
+    ) -> None:
+        try:
+            func()
+        except exc_type:
+            self.passed += 1
+        else:
+            self.failed += 1
+            self.failures.append(f"  FAIL: {desc}")
+
+    def totals(self) -> tuple[int, int, list[str]]:
+        return self.passed, self.failed, self.failures
+
+
 # ---------------------------------------------------------------------------
 # Test cases for _normalize_datetime_filter
 # ---------------------------------------------------------------------------
@@ -156,6 +229,43 @@ def test_normalization() -> tuple[int, int, list[str]]:
     return passed, failed, failures
 
 
+# ---------------------------------------------------------------------------
+# Test cases for _normalize_sort_by / _normalize_logical_operator
+# ---------------------------------------------------------------------------
+# Each tuple: (normalizer, input, expected_output, description)
+SORT_CASES: list[tuple[Callable[[str], str], str, str, str]] = [
+    (_normalize_sort_by, "desc:created", "desc:created", "canonical value unchanged"),
+    (_normalize_sort_by, "DESC:created", "desc:created", "uppercase direction"),
+    (_normalize_sort_by, " asc: name ", "asc:name", "whitespace trimmed"),
+    (_normalize_sort_by, "descending:created", "desc:created", "long-form alias"),
+    (_normalize_sort_by, "created", "created", "bare column unchanged"),
+    (_normalize_logical_operator, "OR", "or", "uppercase logical operator"),
+    (_normalize_logical_operator, " and ", "and", "padded logical operator"),
+]
+
+
+def test_sort_normalization() -> tuple[int, int, list[str]]:
+    """Run all sort/logical-operator normalization cases."""
+    passed = 0
+    failed = 0
+    failures: list[str] = []
+
+    for normalize, inp, expected, desc in SORT_CASES:
+        actual = normalize(inp)
+        if actual == expected:
+            passed += 1
+        else:
+            failed += 1
+            failures.append(
+                f"  FAIL: {desc}\n"
+                f"    input:    {inp!r}\n"
+                f"    expected: {expected!r}\n"
+                f"    actual:   {actual!r}"
+            )
+
+    return passed, failed, failures
+
+
 # ---------------------------------------------------------------------------
 # Test cases for _classify_exception
 # ---------------------------------------------------------------------------
@@ -244,9 +354,573 @@ def test_classify_exception() -> tuple[int, int, list[str]]:
         exc=ValueError("something went wrong"),
     )
 
+    # Deep pagination → ValidationError carrying the actionable hint
+    check(
+        "pagination limit is classified as ValidationError",
+        category="ValidationError",
+        msg_contains="Narrow the query",
+        msg_not_contains="FILTER SYNTAX REFERENCE",
+        tool_name="list_pipeline_runs",
+        exc=_PaginationLimitError("Page 999 with size 50 ... Narrow the query"),
+    )
+
     return passed, failed, failures
 
 
+# ---------------------------------------------------------------------------
+# Test cases for _clamp_pagination
+# ---------------------------------------------------------------------------
+# Each tuple: (input kwargs, expected kwargs after clamping, description)
+PAGINATION_CASES: list[tuple[dict, dict, str]] = [
+    ({"page": 2, "size": 20}, {"page": 2, "size": 20}, "in-range values unchanged"),
+    ({"page": 1, "size": 5000}, {"page": 1, "size": 200}, "oversized page clamped"),
+    ({"page": 0, "size": 0}, {"page": 1, "size": 1}, "non-positive values raised"),
+    ({"name": "x"}, {"name": "x"}, "kwargs without paging untouched"),
+    (
+        {"page": 5000, "size": 10, "cursor": "c"},
+        {"page": 1, "size": 10, "cursor": "c"},
+        "page ignored (not rejected) when a cursor is given",
+    ),
+]
+
+
+def test_clamp_pagination() -> tuple[int, int, list[str]]:
+    """Test _clamp_pagination clamping and deep-offset rejection."""
+    results = _Checks()
+
+    for inp, expected, desc in PAGINATION_CASES:
+        actual = dict(inp)
+        _clamp_pagination(actual)
+        results.check(desc, actual, expected)
+
+    results.raises(
+        "page past the offset limit should raise",
+        _PaginationLimitError,
+        lambda: _clamp_pagination({"page": 1001, "size": 10}),
+    )
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for cursor paging
+# ---------------------------------------------------------------------------
+
+
+def test_list_cursor() -> tuple[int, int, list[str]]:
+    """Test that cursors skip items already returned from the boundary second."""
+    results = _Checks()
+    check = results.check
+
+    def item(item_id: str, second: int, micro: int) -> SimpleNamespace:
+        created = datetime(2026, 2, 1, 12, 0, second, micro)
+        return SimpleNamespace(id=item_id, body=SimpleNamespace(created=created))
+
+    # Newest first; "b" and "c" share second 5 with "a"
+    newest = [item("a", 5, 900), item("b", 5, 500), item("c", 5, 100)]
+    page = Page[Any](index=1, max_size=2, total_pages=2, total=4, items=newest[:2])
+
+    _, cursor = _apply_list_cursor(page, 2, None, [])
+    before, skip_ids = _decode_list_cursor(cursor)
+    check("bound is the second after the last item", before, "2026-02-01 12:00:06")
+    check("boundary-second items are skipped next time", skip_ids, ["a", "b"])
+
+    # Next query (created < bound, size + skipped) returns a, b again plus c, d
+    refetched = Page[Any](
+        index=1,
+        max_size=4,
+        total_pages=1,
+        total=4,
+        items=[*newest, item("d", 3, 0)],
+    )
+    trimmed, cursor = _apply_list_cursor(refetched, 2, before, skip_ids)
+    check("seen items dropped", [i.id for i in trimmed.items], ["c", "d"])
+    check("total counts only the items not yet returned", trimmed.total, 2)
+    check("last page has no next cursor", cursor, None)
+
+    results.raises(
+        "malformed cursor should raise",
+        _PaginationLimitError,
+        lambda: _decode_list_cursor("not-a-cursor"),
+    )
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for _TTLCache
+# ---------------------------------------------------------------------------
+
+
+def test_ttl_cache() -> tuple[int, int, list[str]]:
+    """Test _TTLCache expiry, eviction and pop semantics."""
+    results = _Checks()
+    check = results.check
+
+    cache = _TTLCache(maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    check("fresh entry is returned", cache.get("a"), 1)
+    check("missing key returns default", cache.get("zzz", "dflt"), "dflt")
+
+    cache.set("expired", 2, ttl=-1.0)
+    check("expired entry is a miss", cache.get("expired"), None)
+
+    cache.set("b", 3)
+    cache.set("c", 4)
+    check("oldest entry evicted at maxsize", cache.get("a"), None)
+    check("newest entry kept at maxsize", cache.get("c"), 4)
+
+    check("pop returns the value", cache.pop("c"), 4)
+    check("pop removes the entry", cache.get("c"), None)
+
+    cache.clear()
+    check("clear drops all entries", cache.get("b"), None)
+
+    _recent_error_logs.clear()
+    stderr = io.StringIO()
+    with redirect_stderr(stderr):
+        _log_tool_error("Error in tool: boom")
+        _log_tool_error("Error in tool: boom")
+        _log_tool_error("Error in tool: other")
+    check(
+        "repeated error lines are logged once",
+        stderr.getvalue(),
+        "Error in tool: boom\nError in tool: other\n",
+    )
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for _memoize_lookup
+# ---------------------------------------------------------------------------
+
+
+def test_memoize_lookup() -> tuple[int, int, list[str]]:
+    """Test _memoize_lookup reuses results but never caches error envelopes."""
+    results = _Checks()
+    check = results.check
+
+    calls: list[str] = []
+
+    @_memoize_lookup
+    def get_thing(name_id_or_prefix: str) -> dict:
+        calls.append(name_id_or_prefix)
+        if name_id_or_prefix == "broken":
+            return {"error": {"tool": "get_thing", "message": "x", "type": "Error"}}
+        return {"name": name_id_or_prefix}
+
+    _lookup_cache.clear()
+    get_thing("a")
+    check("repeat lookup is served from cache", get_thing("a"), {"name": "a"})
+    check("backend called once per entity", calls, ["a"])
+
+    get_thing("broken")
+    get_thing("broken")
+    check("error envelopes are not cached", calls.count("broken"), 2)
+
+    _lookup_cache.clear()
+    get_thing("a")
+    check("clear forces a fresh lookup", calls.count("a"), 2)
+
+    @_memoize_lookup(ttl=-1.0)
+    def get_expired(name_id_or_prefix: str) -> dict:
+        calls.append(name_id_or_prefix)
+        return {"name": name_id_or_prefix}
+
+    get_expired("e")
+    get_expired("e")
+    check("per-decorator ttl overrides the default", calls.count("e"), 2)
+
+    @_memoize_lookup
+    def get_slow(name_id_or_prefix: str) -> dict:
+        calls.append(name_id_or_prefix)
+        time.sleep(0.05)
+        return {"name": name_id_or_prefix}
+
+    threads = [Thread(target=get_slow, args=("s",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    check("concurrent identical lookups share one call", calls.count("s"), 1)
+    _lookup_cache.clear()
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for _project_fields
+# ---------------------------------------------------------------------------
+
+RUN_ITEM = {
+    "id": "run-1",
+    "name": "training-run",
+    "permission_denied": False,
+    "body": {"status": "completed", "created": "2026-02-01T00:00:00"},
+    "resources": {"pipeline": {"name": "training"}, "stack": {"name": "default"}},
+}
+
+PROJECTION_CASES: list[tuple[list[str], dict, str]] = [
+    (
+        ["name", "status"],
+        {"id": "run-1", "name": "training-run", "body": {"status": "completed"}},
+        "top-level and body fields kept",
+    ),
+    (
+        ["pipeline"],
+        {"id": "run-1", "resources": {"pipeline": {"name": "training"}}},
+        "resource fields kept, empty sections dropped",
+    ),
+    (["nope"], {"id": "run-1"}, "unknown fields leave only the id"),
+]
+
+
+def test_project_fields() -> tuple[int, int, list[str]]:
+    """Test _project_fields keeps requested fields in their sections."""
+    results = _Checks()
+
+    for fields, expected, desc in PROJECTION_CASES:
+        results.check(desc, _project_fields(RUN_ITEM, fields), expected)
+
+    class Body(BaseModel):
+        status: str
+
+    class Run(BaseModel):
+        id: str
+        name: str
+        body: Body | None = None
+
+    page = Page[Any](
+        index=1,
+        max_size=1,
+        total_pages=1,
+        total=1,
+        items=[Run(id="run-1", name="a", body=Body(status="completed"))],
+    )
+    dumped = _dump_page(page, fields=["name", "status", "stauts"])
+    results.check(
+        "known fields projected",
+        dumped["items"],
+        [{"id": "run-1", "name": "a", "body": {"status": "completed"}}],
+    )
+    results.check(
+        "unknown field names reported", dumped.get("unknown_fields"), ["stauts"]
+    )
+    results.check(
+        "no report when every field exists",
+        "unknown_fields" in _dump_page(page, fields=["status"]),
+        False,
+    )
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for _compact_tool_result
+# ---------------------------------------------------------------------------
+
+
+def test_compact_tool_result() -> tuple[int, int, list[str]]:
+    """Test _compact_tool_result emits compact text alongside the same dict."""
+    results = _Checks()
+    check = results.check
+
+    payload = {"items": [{"id": "run-1", "status": "completed"}], "total": 1}
+    result = _compact_tool_result(payload)
+    check("structured content is the original dict", result.structuredContent, payload)
+    check(
+        "text content is compact JSON",
+        result.content[0].text,
+        '{"items":[{"id":"run-1","status":"completed"}],"total":1}',
+    )
+    check("non-dict results pass through", _compact_tool_result("text"), "text")
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for _prefetch_page
+# ---------------------------------------------------------------------------
+
+
+def test_prefetch_page() -> tuple[int, int, list[str]]:
+    """Test read-ahead de-duplication and invalidation of in-flight fetches."""
+    results = _Checks()
+    check = results.check
+    calls: list[str] = []
+    release = Event()
+
+    def wait_for_read_aheads() -> None:
+        deadline = time.monotonic() + 5
+        while _prefetch_in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def fetch(name: str) -> Callable[[], str]:
+        def _fetch() -> str:
+            calls.append(name)
+            release.wait(5)
+            return name
+
+        return _fetch
+
+    _clear_prefetched_pages()
+    _prefetch_page("k", fetch("first"))
+    _prefetch_page("k", fetch("duplicate"))
+    _clear_prefetched_pages()  # e.g. trigger_pipeline while "first" is running
+    release.set()
+    wait_for_read_aheads()
+    check("a key already being fetched is not fetched again", calls, ["first"])
+    check(
+        "a fetch started before a clear is not parked", _prefetched_pages.get("k"), None
+    )
+
+    _prefetch_page("k", fetch("second"))
+    wait_for_read_aheads()
+    check("later read-aheads are parked", _prefetched_pages.get("k"), "second")
+    _prefetch_page("k", fetch("third"))
+    check("a cached key is not fetched again", calls, ["first", "second"])
+    _clear_prefetched_pages()
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for get_step_logs access-token reuse
+# ---------------------------------------------------------------------------
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, payload: Any) -> None:
+        self.status_code = status_code
+        self.payload = payload
+
+    def json(self) -> Any:
+        return self.payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class _FakeSession:
+    """Mints numbered tokens on login; answers log requests from a script."""
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.log_tokens: list[str] = []
+        self.log_statuses: list[int] = []
+
+    def post(self, url: str, **kwargs: Any) -> _FakeResponse:
+        self.logins += 1
+        return _FakeResponse(
+            200, {"access_token": f"token-{self.logins}", "expires_in": 3600}
+        )
+
+    def get(self, url: str, headers: dict[str, str], **kwargs: Any) -> _FakeResponse:
+        self.log_tokens.append(headers["Authorization"].removeprefix("Bearer "))
+        status = self.log_statuses.pop(0) if self.log_statuses else 200
+        return _FakeResponse(status, [{"message": "hello"}])
+
+
+def test_step_logs_token_cache() -> tuple[int, int, list[str]]:
+    """Test access-token reuse and the single retry after a 401."""
+    results = _Checks()
+    check = results.check
+    run_get_step_logs = get_step_logs.__wrapped__
+
+    session = _FakeSession()
+    saved_session = zenml_server._http_session
+    saved_env = {
+        k: os.environ.get(k) for k in ("ZENML_STORE_URL", "ZENML_STORE_API_KEY")
+    }
+    zenml_server._http_session = session
+    os.environ["ZENML_STORE_URL"] = "https://zenml.example.com/"
+    os.environ["ZENML_STORE_API_KEY"] = "key"
+    _access_tokens.clear()
+    try:
+        check(
+            "logs returned",
+            run_get_step_logs("step-1"),
+            {"logs": [{"message": "hello"}]},
+        )
+        run_get_step_logs("step-2")
+        check("cached token is reused", session.logins, 1)
+        check("both requests used it", session.log_tokens, ["token-1", "token-1"])
+
+        session.log_tokens.clear()
+        session.log_statuses = [401]
+        run_get_step_logs("step-3")
+        check("a 401 evicts the token and logs in again", session.logins, 2)
+        check("the request is retried once", session.log_tokens, ["token-1", "token-2"])
+
+        session.log_tokens.clear()
+        session.log_statuses = [401, 401]
+        results.raises(
+            "a second 401 is raised", requests.HTTPError, lambda: run_get_step_logs("s")
+        )
+        check("no further retries after the second 401", len(session.log_tokens), 2)
+    finally:
+        zenml_server._http_session = saved_session
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        _access_tokens.clear()
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for get_many
+# ---------------------------------------------------------------------------
+
+
+class _FakeEntity(BaseModel):
+    """Minimal stand-in for a ZenML response model in list pages."""
+
+    id: str
+    name: str
+
+
+class _FakeClient:
+    """Records list_* calls and answers them from a fixed set of entities."""
+
+    def __init__(self, entities: list[_FakeEntity]) -> None:
+        self.entities = entities
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., Page[Any]]:
+        if not name.startswith("list_"):
+            raise AttributeError(name)
+
+        def list_method(**kwargs: Any) -> Page[Any]:
+            self.calls.append((name, kwargs))
+            wanted = kwargs.get("id", "")
+            items = [e for e in self.entities if e.id in wanted]
+            return Page[Any](
+                index=1,
+                max_size=kwargs["size"],
+                total_pages=1,
+                total=len(items),
+                items=items,
+            )
+
+        return list_method
+
+
+def test_get_many() -> tuple[int, int, list[str]]:
+    """Test get_many's ID handling, filter construction and project scoping."""
+    results = _Checks()
+    check = results.check
+    run_get_many = get_many.__wrapped__  # the plain function, without the wrapper
+
+    found_id = "7f6c0a52-58a4-4f5c-9a8e-1a2b3c4d5e6f"
+    other_id = "0b1c2d3e-4f50-4612-8a7b-9c0d1e2f3a4b"
+    client = _FakeClient([_FakeEntity(id=found_id, name="run-a")])
+    saved_client = zenml_server.zenml_client
+    zenml_server.zenml_client = client
+    try:
+        result = run_get_many(
+            "pipeline_run", [found_id, found_id.upper(), other_id], project="p1"
+        )
+        name, kwargs = client.calls[-1]
+        check("entity maps to its list method", name, "list_pipeline_runs")
+        check(
+            "duplicate ids collapse into one oneof filter",
+            kwargs["id"],
+            f'oneof:["{found_id}", "{other_id}"]',
+        )
+        check("page size covers every unique id", kwargs["size"], 2)
+        check("project is passed through", kwargs["project"], "p1")
+        check("found items returned", [i["id"] for i in result["items"]], [found_id])
+        check("unfound ids reported", result["missing_ids"], [other_id])
+
+        run_get_many("stack", [found_id])
+        check(
+            "workspace-wide entities get no project",
+            "project" in client.calls[-1][1],
+            False,
+        )
+
+        calls_before = len(client.calls)
+        bad_entity = run_get_many("pipline_run", [found_id])
+        check(
+            "unknown entity type rejected",
+            bad_entity["error"]["type"],
+            "ValidationError",
+        )
+        bad_id = run_get_many("pipeline_run", ["not-a-uuid"])
+        check("non-UUID ids rejected", bad_id["error"]["type"], "ValidationError")
+        check("rejected calls never reach the client", len(client.calls), calls_before)
+    finally:
+        zenml_server.zenml_client = saved_client
+
+    return results.totals()
+
+
+# ---------------------------------------------------------------------------
+# Test cases for _fetch_all_pages / list_all_pipeline_runs
+# ---------------------------------------------------------------------------
+
+
+def _paged_lister(
+    total_pages: int, fail_on: int | None = None
+) -> Callable[..., Page[Any]]:
+    """A fake Client.list_* method; later pages answer sooner than earlier ones."""
+
+    def list_method(page: int, size: int = 2, **kwargs: Any) -> Page[Any]:
+        time.sleep(0.01 * (total_pages - page))
+        if page == fail_on:
+            raise RuntimeError(f"page {page} failed")
+        return Page[Any](
+            index=page,
+            max_size=size,
+            total_pages=total_pages,
+            total=total_pages * size,
+            items=[
+                _FakeEntity(id=f"run-{page}-{i}", name=f"run {page}.{i}")
+                for i in range(size)
+            ],
+        )
+
+    return list_method
+
+
+def test_fetch_all_pages() -> tuple[int, int, list[str]]:
+    """Test page order, truncation and error propagation of concurrent fetches."""
+    results = _Checks()
+    check = results.check
+
+    pages = _fetch_all_pages(_paged_lister(5), 10, size=2)
+    check("pages come back in page order", [p.index for p in pages], [1, 2, 3, 4, 5])
+    pages = _fetch_all_pages(_paged_lister(5), 3, size=2)
+    check("fetching stops at max_pages", [p.index for p in pages], [1, 2, 3])
+    results.raises(
+        "a failure on a later page is raised",
+        RuntimeError,
+        lambda: _fetch_all_pages(_paged_lister(5, fail_on=4), 10, size=2),
+    )
+
+    saved_client = zenml_server.zenml_client
+    zenml_server.zenml_client = SimpleNamespace(list_pipeline_runs=_paged_lister(20))
+    try:
+        result = list_all_pipeline_runs.__wrapped__(size=2, max_pages=50)
+    finally:
+        zenml_server.zenml_client = saved_client
+    check("max_pages is capped", result["pages_fetched"], _FETCH_ALL_MAX_PAGES)
+    check("capped result is marked truncated", result["truncated"], True)
+    check(
+        "items keep page order",
+        [item["id"] for item in result["items"]][:4],
+        ["run-1-0", "run-1-1", "run-2-0", "run-2-1"],
+    )
+    check("items from every fetched page", len(result["items"]), 20)
+
+    return results.totals()
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -269,6 +943,14 @@ def main() -> None:
     all_failures.extend(fails)
     print(f"  {p} passed, {f} failed")
 
+    # Sort / logical operator tests
+    print("\n--- _normalize_sort_by / _normalize_logical_operator ---")
+    p, f, fails = test_sort_normalization()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
     # Classification tests
     print("\n--- _classify_exception ---")
     p, f, fails = test_classify_exception()
@@ -277,6 +959,86 @@ def main() -> None:
     all_failures.extend(fails)
     print(f"  {p} passed, {f} failed")
 
+    # Pagination tests
+    print("\n--- _clamp_pagination ---")
+    p, f, fails = test_clamp_pagination()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # Cursor paging tests
+    print("\n--- _apply_list_cursor / _decode_list_cursor ---")
+    p, f, fails = test_list_cursor()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # Cache tests
+    print("\n--- _TTLCache ---")
+    p, f, fails = test_ttl_cache()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # Lookup memoization tests
+    print("\n--- _memoize_lookup ---")
+    p, f, fails = test_memoize_lookup()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # Field projection tests
+    print("\n--- _project_fields ---")
+    p, f, fails = test_project_fields()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # Compact result serialization tests
+    print("\n--- _compact_tool_result ---")
+    p, f, fails = test_compact_tool_result()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # Read-ahead tests
+    print("\n--- _prefetch_page ---")
+    p, f, fails = test_prefetch_page()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # Access-token cache tests
+    print("\n--- get_step_logs token cache ---")
+    p, f, fails = test_step_logs_token_cache()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # get_many tests
+    print("\n--- get_many ---")
+    p, f, fails = test_get_many()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
+    # Concurrent multi-page fetch tests
+    print("\n--- _fetch_all_pages / list_all_pipeline_runs ---")
+    p, f, fails = test_fetch_all_pages()
+    total_passed += p
+    total_failed += f
+    all_failures.extend(fails)
+    print(f"  {p} passed, {f} failed")
+
     # Summary
     print("\n" + "=" * 60)
     if all_failures:
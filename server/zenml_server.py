@@ -9,27 +9,39 @@
 # ]
 # ///
 
-# Ensure setuptools is imported first to provide distutils compatibility
-try:
-    import setuptools  # noqa
-except ImportError:
-    pass
-
+import asyncio
+import base64
 import functools
+import inspect
 import json
 import logging
 import os
 import re
 import sys
+import time
 import warnings
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, ParamSpec, TypeVar, cast, get_type_hints
+from typing import (
+    Any,
+    Dict,
+    Literal,
+    ParamSpec,
+    TypeVar,
+    cast,
+    get_args,
+    get_type_hints,
+)
 from urllib.parse import urlparse
+from uuid import UUID
 
+import pydantic_core
 import requests
 import zenml_mcp_analytics as analytics
+from mcp.types import CallToolResult, TextContent
 
 # Suppress ZenML warnings that print to stdout (breaks JSON-RPC protocol)
 # E.g., "Setting the global active stack to default"
@@ -82,7 +94,7 @@ T = TypeVar("T")  # Captures return type
 
 # Type alias for functions (callables with __name__ attribute)
 # Using ParamSpec preserves the original function's parameter types
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 
 def _is_text_tool(func: Callable[..., Any]) -> bool:
@@ -254,6 +266,185 @@ def _normalize_datetime_filter(value: str) -> str:
     return f"{op}:{norm}" if op else norm
 
 
+# =============================================================================
+# Sort / logical operator normalization
+# =============================================================================
+# ZenML only recognizes lowercase 'asc:'/'desc:' prefixes; anything else (e.g.
+# 'DESC:created' from an LLM) silently falls back to ascending order. Agents
+# send the same handful of values over and over, so results are memoized.
+
+_SORT_DIRECTION_ALIASES = {"ascending": "asc", "descending": "desc"}
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_sort_by(value: str) -> str:
+    """Normalize a sort_by value to ZenML's '<asc|desc>:<field>' form."""
+    raw = value.strip()
+    direction, sep, column = raw.partition(":")
+    if not sep:
+        return raw
+    direction = direction.strip().lower()
+    direction = _SORT_DIRECTION_ALIASES.get(direction, direction)
+    return f"{direction}:{column.strip()}"
+
+
+@functools.lru_cache(maxsize=8)
+def _normalize_logical_operator(value: str) -> str:
+    """Normalize a logical_operator value to ZenML's lowercase 'and'/'or'."""
+    return value.strip().lower()
+
+
+# =============================================================================
+# Pagination guards
+# =============================================================================
+# ZenML list endpoints paginate with OFFSET, so very large pages or very deep
+# page numbers turn into expensive scans on the server. Page sizes are clamped
+# and requests that would skip past _MAX_LIST_OFFSET rows are rejected with a
+# hint to narrow the query instead.
+
+_MAX_LIST_PAGE_SIZE = 200
+_MAX_LIST_OFFSET = 10_000
+
+
+class _PaginationLimitError(ValueError):
+    """Raised when a list tool's paging arguments can't be served.
+
+    Either the requested page starts past _MAX_LIST_OFFSET or a cursor is
+    invalid or can't be combined with the other arguments.
+    """
+
+
+def _clamp_pagination(kwargs: dict[str, Any]) -> None:
+    """Clamp 'page'/'size' kwargs of a list tool in place.
+
+    A 'cursor' replaces page-based paging, so 'page' is reset to 1 when one
+    is given rather than checked against the offset limit.
+
+    Raises:
+        _PaginationLimitError: If the requested page starts past _MAX_LIST_OFFSET.
+    """
+    if kwargs.get("cursor") and "page" in kwargs:
+        kwargs["page"] = 1
+    page = kwargs.get("page")
+    size = kwargs.get("size")
+    if isinstance(size, int):
+        size = kwargs["size"] = max(1, min(size, _MAX_LIST_PAGE_SIZE))
+    if isinstance(page, int):
+        page = kwargs["page"] = max(1, page)
+    if isinstance(page, int) and isinstance(size, int):
+        if (page - 1) * size >= _MAX_LIST_OFFSET:
+            raise _PaginationLimitError(
+                f"Page {page} with size {size} starts past the first "
+                f"{_MAX_LIST_OFFSET} results. Narrow the query with filters "
+                "(e.g. created='gte:2026-02-01 00:00:00'), change sort_by, or "
+                "page with 'cursor' where the tool supports it instead of "
+                "paging this deep."
+            )
+
+
+# Cursor (keyset) paging for the large, time-ordered lists (runs, steps).
+# Instead of an OFFSET, a cursor turns the next page into a filter on
+# 'created' so every page is a page-1 query. ZenML datetime filters have
+# one-second resolution, so the cursor holds the exclusive upper bound (the
+# second after the last returned item) plus the IDs already returned from
+# that boundary second, which are fetched again and skipped.
+_CURSOR_SORT_BY = "desc:created"
+_CURSOR_MAX_SKIP_IDS = 1000
+
+
+def _decode_list_cursor(cursor: str) -> tuple[str, list[str]]:
+    """Decode a list cursor into its 'created' upper bound and IDs to skip.
+
+    Raises:
+        _PaginationLimitError: If the cursor is malformed.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        before, skip_ids = data["before"], data["skip"]
+        datetime.strptime(before, "%Y-%m-%d %H:%M:%S")
+        if not isinstance(skip_ids, list):
+            raise TypeError("cursor skip list is not a list")
+    except (ValueError, KeyError, TypeError) as e:
+        raise _PaginationLimitError(
+            "Invalid cursor. Pass the 'next_cursor' value from the previous "
+            "response unchanged, or omit 'cursor' to start from the newest item."
+        ) from e
+    if len(skip_ids) > _CURSOR_MAX_SKIP_IDS:
+        raise _PaginationLimitError(
+            f"More than {_CURSOR_MAX_SKIP_IDS} results were created within the "
+            "same second. Narrow the query with filters to page past them."
+        )
+    return before, [str(i) for i in skip_ids]
+
+
+def _created_second(item: Any) -> datetime:
+    """Return an item's creation time as a naive UTC datetime, whole seconds."""
+    created = item.body.created
+    if created.tzinfo is not None:
+        created = created.astimezone(timezone.utc).replace(tzinfo=None)
+    return created.replace(microsecond=0)
+
+
+def _apply_list_cursor(
+    page: Any, size: int, before: str | None, skip_ids: list[str]
+) -> tuple[Any, str | None]:
+    """Trim a desc:created page fetched for a cursor and build the next cursor.
+
+    ``page`` must have been fetched with ``size + len(skip_ids)`` items and
+    ``created='lt:<before>'`` (or no created filter for the first page).
+
+    Returns:
+        The page reduced to at most ``size`` unseen items, and the cursor for
+        the following page (None when there are no more items). The page's
+        ``total``/``total_pages`` count only the items from this page onwards,
+        i.e. those not returned by earlier cursor pages.
+    """
+    skip = set(skip_ids)
+    unseen = [item for item in page.items if str(item.id) not in skip]
+    items = unseen[:size]
+    total = page.total - (len(page.items) - len(unseen))
+    # Also correct for a page-based fetch (index > 1) used to seed a cursor
+    remaining = total - (page.index - 1) * page.max_size - len(items)
+    trimmed = page.model_copy(
+        update={
+            "items": items,
+            "index": 1,
+            "max_size": size,
+            "total": total,
+            "total_pages": max(1, -(-total // size)),
+        }
+    )
+    if not items or remaining <= 0:
+        return trimmed, None
+
+    last_second = _created_second(items[-1])
+    next_before = (last_second + timedelta(seconds=1)).strftime("%Y-%m-%d %H:%M:%S")
+    next_skip = [str(i.id) for i in items if _created_second(i) == last_second]
+    if next_before == before:
+        # The whole page fell in the same second as the previous boundary
+        next_skip = skip_ids + next_skip
+    next_cursor = base64.urlsafe_b64encode(
+        json.dumps({"before": next_before, "skip": next_skip}).encode()
+    ).decode("ascii")
+    return trimmed, next_cursor
+
+
+def _check_cursor_args(
+    sort_by: str, logical_operator: str, created: str | None
+) -> None:
+    """Reject argument combinations a cursor can't be combined with.
+
+    Raises:
+        _PaginationLimitError: If the arguments conflict with cursor paging.
+    """
+    if sort_by != _CURSOR_SORT_BY or logical_operator != "and" or created:
+        raise _PaginationLimitError(
+            f"'cursor' requires sort_by='{_CURSOR_SORT_BY}', "
+            "logical_operator='and' and no 'created' filter (the cursor is a "
+            "filter on 'created'). Use start_time/end_time to bound the range."
+        )
+
+
 # =============================================================================
 # Exception classification (stable categories + actionable user messages)
 # =============================================================================
@@ -365,6 +556,10 @@ def _classify_exception(
             )
         return ("ValidationError", msg, details)
 
+    # ---- Pagination limits (raised before any request is made) ----
+    if isinstance(exc, _PaginationLimitError):
+        return ("ValidationError", str(exc), details)
+
     # ---- Common configuration errors (missing env vars) ----
     if isinstance(exc, ValueError):
         msg = str(exc)
@@ -484,24 +679,27 @@ def _get_mcp_client_info_safe() -> dict[str, Any] | None:
 
 
 # Decorator for handling exceptions in tool functions (with analytics tracking)
-def handle_tool_exceptions(func: Callable[P, T]) -> Callable[P, T]:
+def handle_tool_exceptions(
+    func: Callable[P, T],
+) -> Callable[P, Awaitable[T | CallToolResult]]:
     """Decorator for MCP tools - handles exceptions and tracks analytics.
 
     Use this decorator for @mcp.tool() functions. It:
     - Catches exceptions and returns friendly error messages
     - Tracks tool usage via analytics (timing, success/failure, size param)
     - Returns structured error dicts for structured tools, strings for text tools
+    - Runs the (sync) tool in a worker thread, so the decorated tool is async
+    - Serializes structured results to compact JSON (see _compact_tool_result)
     """
     # Capture function name and return type at decoration time.
     # getattr-with-default keeps the type checker honest: a generic Callable
     # isn't guaranteed to have __name__, even though our decorated tools always do.
     func_name = getattr(func, "__name__", "unknown_tool")
     text_tool = _is_text_tool(func)
+    paginated = {"page", "size"} <= inspect.signature(func).parameters.keys()
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        import time
-
         global _mcp_client_info_captured
 
         start_time = time.perf_counter()
@@ -526,13 +724,21 @@ def handle_tool_exceptions(func: Callable[P, T]) -> Callable[P, T]:
             client = None
 
         try:
-            # Normalize datetime filter kwargs before calling the tool.
+            # Normalize filters/sorting and clamp pagination before calling the tool.
             # Uses a copy so analytics.extract_size_from_call sees original kwargs.
             call_kwargs = dict(kwargs) if kwargs else kwargs
             if call_kwargs:
                 for key in _DATETIME_FILTER_KEYS:
                     if key in call_kwargs and isinstance(call_kwargs[key], str):
                         call_kwargs[key] = _normalize_datetime_filter(call_kwargs[key])
+                if isinstance(call_kwargs.get("sort_by"), str):
+                    call_kwargs["sort_by"] = _normalize_sort_by(call_kwargs["sort_by"])
+                if isinstance(call_kwargs.get("logical_operator"), str):
+                    call_kwargs["logical_operator"] = _normalize_logical_operator(
+                        call_kwargs["logical_operator"]
+                    )
+                if paginated:
+                    _clamp_pagination(call_kwargs)
 
             result = func(*args, **call_kwargs)
             # Detect structured error envelopes (full shape validation to avoid
@@ -561,7 +767,7 @@ def handle_tool_exceptions(func: Callable[P, T]) -> Callable[P, T]:
                 err_log = f"{err_log} (HTTP {http_status_code})"
             if analytics.DEV_MODE:
                 err_log = f"{err_log} - {e}"
-            print(err_log, file=sys.stderr)
+            _log_tool_error(err_log)
 
             if text_tool:
                 return cast(T, message)
@@ -583,7 +789,7 @@ def handle_tool_exceptions(func: Callable[P, T]) -> Callable[P, T]:
             )
             error_type = category
 
-            print(message, file=sys.stderr)
+            _log_tool_error(message)
 
             if text_tool:
                 return cast(T, message)
@@ -607,16 +813,47 @@ def handle_tool_exceptions(func: Callable[P, T]) -> Callable[P, T]:
             except Exception:
                 pass
 
-    return wrapper
+    # FastMCP calls sync tools directly on the event loop, so one slow ZenML
+    # request would stall every other in-flight request. Register an async
+    # wrapper that runs the tool in a worker thread instead (contextvars are
+    # copied, so the MCP request context is still available).
+    @functools.wraps(func)
+    async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T | CallToolResult:
+        if text_tool:
+            return await asyncio.to_thread(wrapper, *args, **kwargs)
+        return await asyncio.to_thread(
+            lambda: _compact_tool_result(wrapper(*args, **kwargs))
+        )
+
+    return async_wrapper
+
+
+def _compact_tool_result(result: Any) -> Any:
+    """Wrap a structured tool result in a CallToolResult with compact JSON text.
+
+    Left to itself, FastMCP renders the text content of a dict result with
+    ``indent=2``; rendering it here without indentation, in the worker thread,
+    saves that whitespace. ``structuredContent`` is the same dict, and FastMCP
+    still validates it against the tool's output model.
+    """
+    if not isinstance(result, dict):
+        return result
+
+    text = pydantic_core.to_json(result, fallback=str).decode()
+    return CallToolResult(
+        content=[TextContent(type="text", text=text)],
+        structuredContent=result,
+    )
 
 
 # Decorator for handling exceptions in prompts/resources (no analytics)
-def handle_exceptions(func: Callable[P, T]) -> Callable[P, T]:
+def handle_exceptions(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
     """Decorator for prompts/resources - handles exceptions without analytics.
 
     Use this decorator for @mcp.prompt() and @mcp.resource() functions.
     It catches exceptions but does NOT track analytics (to avoid noise from
-    non-tool endpoints).
+    non-tool endpoints). Like tools, the (sync) handler runs in a worker
+    thread, so the decorated handler is async.
     """
     # Capture function name at decoration time. getattr-with-default avoids type
     # checker issues: a generic Callable isn't guaranteed to expose __name__.
@@ -628,12 +865,20 @@ def handle_exceptions(func: Callable[P, T]) -> Callable[P, T]:
             return func(*args, **kwargs)
         except Exception as e:
             error_type = type(e).__name__
-            error_detail = str(e) if analytics.DEV_MODE else error_type
+            # Bounded: str() of e.g. a large pydantic ValidationError can run
+            # to many KB, which would all be echoed to stderr and the client
+            error_detail = str(e)[:2000] if analytics.DEV_MODE else error_type
             message = f"Error in {func_name}: {error_detail}"
-            print(message, file=sys.stderr)
+            _log_tool_error(message)
             return cast(T, message)
 
-    return wrapper
+    # Same reason as in handle_tool_exceptions: resources such as
+    # most_recent_runs make blocking ZenML calls
+    @functools.wraps(func)
+    async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        return await asyncio.to_thread(wrapper, *args, **kwargs)
+
+    return async_wrapper
 
 
 INSTRUCTIONS = """
@@ -847,13 +1092,38 @@ except Exception as e:
     raise
 
 
+def _enable_distutils_compat() -> None:
+    """Import setuptools so its distutils shim is active before ZenML loads.
+
+    ZenML imports distutils, which is no longer in the stdlib on Python 3.12+.
+    Called right before ZenML is first imported rather than at module load,
+    keeping the setuptools import off the server's startup path.
+    """
+    try:
+        import setuptools  # noqa
+    except ImportError:
+        pass
+
+
 # Track if we've already reported client init failure (avoid spam)
 _client_init_failure_reported = False
 _zenml_client_init_lock = Lock()
 
 
+# Tool calls run concurrently in worker threads (and list_all_* tools fan out
+# further), which can exceed ZenML's default REST connection pool of 10. Past
+# that, urllib3 opens a throwaway connection - a fresh TLS handshake - per
+# extra request instead of reusing a pooled keep-alive one.
+_ZENML_CONNECTION_POOL_SIZE = 32
+
+
 def get_zenml_client():
-    """Get or initialize the ZenML client lazily."""
+    """Get or initialize the ZenML client lazily.
+
+    The client is built once per process (double-checked under a lock) and
+    shared by every tool call, so its REST session and auth token are reused
+    rather than re-established per call.
+    """
     global zenml_client, _client_init_failure_reported
     if zenml_client is not None:
         return zenml_client
@@ -863,8 +1133,16 @@ def get_zenml_client():
             return zenml_client
 
         logger.debug("Lazy importing ZenML...")
+        _enable_distutils_compat()
         from zenml.client import Client
 
+        # ZenML reads ZENML_STORE_* variables into the store configuration,
+        # so this sizes the REST session's pool when the store is created
+        # (an explicit setting wins)
+        os.environ.setdefault(
+            "ZENML_STORE_CONNECTION_POOL_SIZE", str(_ZENML_CONNECTION_POOL_SIZE)
+        )
+
         logger.debug("Initializing ZenML client...")
         try:
             zenml_client = Client()
@@ -885,10 +1163,308 @@ def get_zenml_client():
     return zenml_client
 
 
+# Sections of a ZenML response model that hold the entity's actual fields
+_RESPONSE_SECTIONS = ("body", "metadata", "resources")
+
+
+def _project_fields(item: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+    """Keep only the requested fields of a dumped ZenML response item.
+
+    Field names are matched at the top level and inside the body, metadata
+    and resources sections, so the response keeps its usual shape. The 'id'
+    is always kept.
+    """
+    wanted = set(fields)
+    projected: dict[str, Any] = {"id": item.get("id")}
+    for key, value in item.items():
+        if key in wanted:
+            projected[key] = value
+        elif key in _RESPONSE_SECTIONS and isinstance(value, dict):
+            section = {k: v for k, v in value.items() if k in wanted}
+            if section:
+                projected[key] = section
+    return projected
+
+
+@functools.cache
+def _response_field_names(model_cls: type) -> frozenset[str]:
+    """All field names of a ZenML response model, including its sections."""
+    model_fields = getattr(model_cls, "model_fields", {})
+    names = set(model_fields)
+    for section in _RESPONSE_SECTIONS:
+        if section not in model_fields:
+            continue
+        for section_cls in (
+            model_fields[section].annotation,
+            *get_args(model_fields[section].annotation),
+        ):
+            names.update(getattr(section_cls, "model_fields", {}))
+    return frozenset(names)
+
+
+def _dump_page(
+    page: Any, verbose: bool = False, fields: list[str] | None = None
+) -> dict[str, Any]:
+    """Serialize a ZenML ``Page`` returned by a list call for a tool result.
+
+    All list tools return through here so page serialization is defined once.
+    Unless ``verbose`` is set, null fields are dropped: ZenML entities carry
+    many optional fields that are usually unset, and omitting them keeps list
+    responses much smaller for the MCP client. If ``fields`` is given, each
+    item is reduced to those fields (see ``_project_fields``), and any that
+    the entity doesn't have are listed under ``unknown_fields``.
+    """
+    if not fields:
+        return page.model_dump(mode="json", exclude_none=not verbose)
+    # Dump items one by one so the projection never holds the full page dump
+    result = page.model_dump(mode="json", exclude={"items"})
+    result["items"] = [
+        _project_fields(item.model_dump(mode="json", exclude_none=not verbose), fields)
+        for item in page.items
+    ]
+    if page.items:
+        known = _response_field_names(type(page.items[0]))
+        unknown = [f for f in fields if f not in known]
+        if unknown:
+            result["unknown_fields"] = unknown
+    return result
+
+
+# =============================================================================
+# In-process response caching
+# =============================================================================
+
+
+class _TTLCache:
+    """Small thread-safe cache whose entries expire after a fixed TTL.
+
+    Stdlib-only on purpose: runtime dependencies are pinned with hashes, and
+    the server only needs get/set/pop/clear. When ``maxsize`` is reached the
+    oldest entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[Any, tuple[float, Any]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            return entry[1]
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None or entry[0] <= time.monotonic():
+                return default
+            return entry[1]
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                # dicts keep insertion order, so the first key is the oldest
+                del self._data[next(iter(self._data))]
+            self._data[key] = (expires_at, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Results of read-only tools for slowly-changing data (users, stacks, models,
+# flavors, ...), so an agent re-asking about the same thing within a few
+# seconds doesn't cost another REST round-trip. Cleared when a tool changes
+# server state (trigger_pipeline).
+_lookup_cache = _TTLCache(maxsize=256, ttl=15.0)
+
+
+# Finished runs and steps (and step source code) no longer change apart from
+# later additions like tags or metadata, so they are kept much longer than
+# other lookups. Unfinished runs/steps are never stored: their status is live.
+_finished_cache = _TTLCache(maxsize=256, ttl=600.0)
+
+
+# Error lines written to stderr in the last second. When the ZenML server is
+# down every tool call fails the same way, and on stdio transports stderr is a
+# pipe the client has to drain, so repeats are dropped rather than echoed.
+_recent_error_logs = _TTLCache(maxsize=256, ttl=1.0)
+
+
+def _log_tool_error(message: str) -> None:
+    """Print a tool error to stderr unless it was just printed."""
+    if _recent_error_logs.get(message) is not None:
+        return
+    _recent_error_logs.set(message, True)
+    print(message, file=sys.stderr)
+
+
+# Per-key locks for lookups currently being fetched (see _memoize_lookup)
+_lookup_inflight: dict[Any, Lock] = {}
+_lookup_inflight_lock = Lock()
+
+
+def _memoize_lookup(
+    func: Callable[P, T] | None = None, *, ttl: float | None = None
+) -> Any:
+    """Cache a read-only tool's result in ``_lookup_cache``.
+
+    Use as ``@_memoize_lookup``, or as ``@_memoize_lookup(ttl=...)`` for data
+    that changes even more rarely than the default TTL assumes. Apply below
+    @handle_tool_exceptions so exceptions are never cached and the call is
+    still tracked. Error envelopes returned by the tool are not cached either.
+    Concurrent calls with the same arguments share a single fetch.
+    """
+    if func is None:
+        return functools.partial(_memoize_lookup, ttl=ttl)
+    func_name = getattr(func, "__name__", "unknown_tool")
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = (func_name, args, tuple(sorted(kwargs.items())))
+        try:
+            cached = _lookup_cache.get(key)
+        except TypeError:  # Unhashable argument (e.g. a list): don't cache
+            return func(*args, **kwargs)
+        if cached is not None:
+            return cached
+        # Concurrent misses for the same key (an agent fanning out identical
+        # lookups) wait for the first one instead of each hitting the server
+        with _lookup_inflight_lock:
+            inflight = _lookup_inflight.setdefault(key, Lock())
+        try:
+            with inflight:
+                cached = _lookup_cache.get(key)
+                if cached is not None:
+                    return cached
+                result = func(*args, **kwargs)
+                if not _is_structured_error_envelope(result):
+                    _lookup_cache.set(key, result, ttl=ttl)
+                return result
+        finally:
+            with _lookup_inflight_lock:
+                if _lookup_inflight.get(key) is inflight:
+                    del _lookup_inflight[key]
+
+    return wrapper
+
+
+# Read-ahead for paginated tools: when an agent reads the first page of a
+# multi-page result (or a page that was itself read ahead), fetch the next page
+# in the background. At most one page ahead, only for modest page sizes, and
+# each prefetched page is served once and expires quickly since it is live data.
+_PREFETCH_MAX_PAGE_SIZE = 50
+_PREFETCH_MAX_IN_FLIGHT = 4
+_prefetched_pages = _TTLCache(maxsize=16, ttl=10.0)
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="zenml-mcp-prefetch"
+)
+_prefetch_in_flight: set[Any] = set()
+_prefetch_lock = Lock()
+# Bumped whenever read-ahead pages are discarded, so a fetch that was already
+# running at that point doesn't park its (possibly stale) page afterwards
+_prefetch_generation = 0
+
+
+def _prefetch_page(key: Any, fetch: Callable[[], Any]) -> None:
+    """Fetch a page in the background and park it in the read-ahead cache.
+
+    Skipped if the page is already cached or being fetched, or if too many
+    read-aheads are queued, so concurrent clients can't pile up extra calls.
+    """
+    with _prefetch_lock:
+        if (
+            key in _prefetch_in_flight
+            or len(_prefetch_in_flight) >= _PREFETCH_MAX_IN_FLIGHT
+            or _prefetched_pages.get(key) is not None
+        ):
+            return
+        _prefetch_in_flight.add(key)
+        generation = _prefetch_generation
+
+    def _worker() -> None:
+        try:
+            page = fetch()
+            with _prefetch_lock:
+                if generation == _prefetch_generation:
+                    _prefetched_pages.set(key, page)
+        except Exception as e:
+            # Best-effort: the real call will surface any error
+            logger.debug(f"Read-ahead of {key!r} failed: {e}")
+        finally:
+            with _prefetch_lock:
+                _prefetch_in_flight.discard(key)
+
+    _prefetch_executor.submit(_worker)
+
+
+def _clear_prefetched_pages() -> None:
+    """Drop all read-ahead pages, including ones still being fetched."""
+    global _prefetch_generation
+    with _prefetch_lock:
+        _prefetch_generation += 1
+        _prefetched_pages.clear()
+
+
+# Concurrent fan-out for list_all_* tools: once the first page reports how many
+# pages there are, the remaining ones are fetched in parallel
+_FETCH_ALL_MAX_PAGES = 10
+_FETCH_ALL_MAX_WORKERS = 4
+
+
+def _fetch_all_pages(
+    list_method: Callable[..., Any], max_pages: int, **kwargs: Any
+) -> list[Any]:
+    """Fetch pages 1..N of a Client.list_* call, pages 2..N concurrently.
+
+    N is the smaller of the result's total_pages and ``max_pages``.
+    """
+    first_page = list_method(page=1, **kwargs)
+    last_page = min(first_page.total_pages, max_pages)
+    if last_page <= 1:
+        return [first_page]
+    with ThreadPoolExecutor(
+        max_workers=min(_FETCH_ALL_MAX_WORKERS, last_page - 1),
+        thread_name_prefix="zenml-mcp-fetch",
+    ) as pool:
+        other_pages = pool.map(
+            lambda page: list_method(page=page, **kwargs),
+            range(2, last_page + 1),
+        )
+        return [first_page, *other_pages]
+
+
+# Shared HTTP session for direct ZenML API calls, so token requests and log
+# fetches reuse pooled keep-alive connections instead of a new TLS handshake
+# per call. Cookies are not persisted: every request authenticates explicitly.
+_http_session = requests.Session()
+_http_session.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+)
+_http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+
+# Access tokens minted from the API key, keyed by (server_url, api_key) and
+# reused until shortly before they expire
+_access_tokens = _TTLCache(maxsize=4, ttl=900.0)
+_ACCESS_TOKEN_EXPIRY_MARGIN = 30.0
+
+
 def get_access_token(server_url: str, api_key: str) -> str:
     """
     Generate a short-lived access token using the ZenML API key.
 
+    Tokens are cached and reused until ~30s before the server-reported
+    expiry, so repeated log fetches don't log in again on every call.
+
     Args:
         server_url: The base URL of the ZenML server
         api_key: The ZenML API key
@@ -903,13 +1479,18 @@ def get_access_token(server_url: str, api_key: str) -> str:
     # Ensure the server URL doesn't end with a slash
     server_url = server_url.rstrip("/")
 
+    cache_key = (server_url, api_key)
+    cached_token = _access_tokens.get(cache_key)
+    if cached_token is not None:
+        return cached_token
+
     # Construct the login URL
     url = f"{server_url}/api/v1/login"
 
     logger.debug("Generating access token")
 
     # Make the request to get an access token
-    response = requests.post(
+    response = _http_session.post(
         url,
         data={"password": api_key},
         headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -924,7 +1505,17 @@ def get_access_token(server_url: str, api_key: str) -> str:
     if "access_token" not in token_data:
         raise ValueError("No access token in response")
 
-    return token_data["access_token"]
+    access_token = token_data["access_token"]
+    expires_in = token_data.get("expires_in")
+    if expires_in is None:
+        _access_tokens.set(cache_key, access_token)
+    else:
+        _access_tokens.set(
+            cache_key,
+            access_token,
+            ttl=max(float(expires_in) - _ACCESS_TOKEN_EXPIRY_MARGIN, 0.0),
+        )
+    return access_token
 
 
 def make_step_logs_request(
@@ -955,7 +1546,7 @@ def make_step_logs_request(
     logger.debug(f"Fetching logs for step {step_id}")
 
     # Make the request
-    response = requests.get(url, headers=headers, timeout=(3.05, 30))
+    response = _http_session.get(url, headers=headers, timeout=(3.05, 30))
     response.raise_for_status()  # Raise an exception for HTTP errors
 
     data = response.json()
@@ -1000,6 +1591,7 @@ def collect_zenml_setup_diagnostics(
 
     # ZenML import check (no Client() call)
     try:
+        _enable_distutils_compat()
         import zenml as _zenml
 
         checks["zenml"] = {
@@ -1111,11 +1703,20 @@ def get_step_logs(step_run_id: str) -> dict[str, Any]:
     if not api_key:
         raise ValueError("ZENML_STORE_API_KEY environment variable not set")
 
-    # Generate a short-lived access token
+    # Generate (or reuse) a short-lived access token
     access_token = get_access_token(server_url, api_key)
 
     # Get the logs using the access token
-    return make_step_logs_request(server_url, step_run_id, access_token)
+    try:
+        return make_step_logs_request(server_url, step_run_id, access_token)
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code != 401:
+            raise
+        # The cached token was revoked or expired early: mint a new one and
+        # retry once
+        _access_tokens.pop((server_url.rstrip("/"), api_key))
+        access_token = get_access_token(server_url, api_key)
+        return make_step_logs_request(server_url, step_run_id, access_token)
 
 
 # Page-size defaults for list tools:
@@ -1132,6 +1733,7 @@ def list_users(
     created: str | None = None,
     updated: str | None = None,
     active: bool | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all users in the ZenML workspace.
 
@@ -1150,6 +1752,8 @@ def list_users(
         created: Filter by creation time (e.g. gte:2026-01-01 00:00:00)
         updated: Filter by update time (same syntax as created)
         active: Filter by active status
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     users = get_zenml_client().list_users(
         sort_by=sort_by,
@@ -1160,11 +1764,12 @@ def list_users(
         updated=updated,
         active=active,
     )
-    return users.model_dump(mode="json")
+    return _dump_page(users, verbose)
 
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_user(name_id_or_prefix: str) -> dict[str, Any]:
     """Get detailed information about a specific user.
 
@@ -1177,6 +1782,7 @@ def get_user(name_id_or_prefix: str) -> dict[str, Any]:
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup(ttl=300.0)
 def get_active_user() -> dict[str, Any]:
     """Get the currently active user."""
     user = get_zenml_client().active_user
@@ -1190,6 +1796,7 @@ def get_active_user() -> dict[str, Any]:
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup(ttl=300.0)
 def get_active_project() -> dict[str, Any]:
     """Get the currently active project.
 
@@ -1224,6 +1831,7 @@ def list_projects(
     updated: str | None = None,
     name: str | None = None,
     display_name: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all projects in the ZenML workspace.
 
@@ -1243,6 +1851,8 @@ def list_projects(
         updated: Filter by update time (same syntax as created)
         name: Filter by project name
         display_name: Filter by project display name
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     projects = get_zenml_client().list_projects(
         sort_by=sort_by,
@@ -1254,11 +1864,12 @@ def list_projects(
         name=name,
         display_name=display_name,
     )
-    return projects.model_dump(mode="json")
+    return _dump_page(projects, verbose)
 
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_stack(name_id_or_prefix: str) -> dict[str, Any]:
     """Get detailed information about a specific stack.
 
@@ -1291,6 +1902,7 @@ def easter_egg() -> str:
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def list_stacks(
     sort_by: str = "desc:created",
     page: int = 1,
@@ -1299,6 +1911,7 @@ def list_stacks(
     created: str | None = None,
     updated: str | None = None,
     name: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all stacks in the ZenML workspace.
 
@@ -1316,6 +1929,8 @@ def list_stacks(
         created: Filter by creation time (e.g. gte:2026-02-01 00:00:00)
         updated: Filter by update time (same syntax as created)
         name: Filter by stack name (e.g. contains:prod)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     stacks = get_zenml_client().list_stacks(
         sort_by=sort_by,
@@ -1326,7 +1941,7 @@ def list_stacks(
         updated=updated,
         name=name,
     )
-    return stacks.model_dump(mode="json")
+    return _dump_page(stacks, verbose)
 
 
 @mcp.tool()
@@ -1337,6 +1952,8 @@ def list_pipelines(
     size: int = 20,
     created: str | None = None,
     updated: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all pipelines in the ZenML workspace.
 
@@ -1352,6 +1969,12 @@ def list_pipelines(
         size: Results per page
         created: Filter by creation time (e.g. gte:2026-02-01 00:00:00)
         updated: Filter by update time (same syntax as created)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["name",
+            "latest_run_status", "created"] (matched inside
+            body/metadata/resources; 'id' is always kept; names that don't
+            exist are listed in 'unknown_fields'). Omit to return full items
     """
     pipelines = get_zenml_client().list_pipelines(
         sort_by=sort_by,
@@ -1360,21 +1983,29 @@ def list_pipelines(
         created=created,
         updated=updated,
     )
-    return pipelines.model_dump(mode="json")
+    return _dump_page(pipelines, verbose, fields)
 
 
 def _get_latest_runs_status(
-    pipeline_response,  # PipelineResponse - imported lazily
+    pipeline_name_or_id: str,
     num_runs: int = 5,
 ) -> list[str]:
     """Get the status of the latest runs of a pipeline.
 
     Args:
-        pipeline_response: The pipeline response to get the latest runs from
+        pipeline_name_or_id: The exact name or full ID of the pipeline
         num_runs: The number of runs to get the status of
     """
-    latest_runs = pipeline_response.runs[:num_runs]
-    return [str(run.status) for run in latest_runs]
+    # Not PipelineResponse.runs: that always fetches 20 full runs through a
+    # fresh Client, however few statuses were asked for
+    if num_runs < 1:
+        return []
+    latest_runs = get_zenml_client().list_pipeline_runs(
+        pipeline=pipeline_name_or_id,
+        sort_by="desc:created",
+        size=min(num_runs, _MAX_LIST_PAGE_SIZE),
+    )
+    return [str(run.status) for run in latest_runs.items]
 
 
 @mcp.tool()
@@ -1389,16 +2020,27 @@ def get_pipeline_details(
         name_id_or_prefix: The name, ID or prefix of the pipeline to retrieve
         num_runs: The number of runs to get the status of
     """
-    pipeline = get_zenml_client().get_pipeline(name_id_or_prefix)
+    # The run query filters on the same name/ID, so it runs alongside the
+    # pipeline lookup instead of waiting for the resolved pipeline
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="zenml-mcp-fetch"
+    ) as pool:
+        statuses = pool.submit(_get_latest_runs_status, name_id_or_prefix, num_runs)
+        pipeline = get_zenml_client().get_pipeline(name_id_or_prefix)
+        latest_runs_status = statuses.result()
+    if name_id_or_prefix not in (pipeline.name, str(pipeline.id)):
+        # Resolved from an ID prefix, which the run filter can't match exactly
+        latest_runs_status = _get_latest_runs_status(str(pipeline.id), num_runs)
     return {
         "pipeline": pipeline.model_dump(mode="json"),
-        "latest_runs_status": _get_latest_runs_status(pipeline, num_runs),
+        "latest_runs_status": latest_runs_status,
         "num_runs": num_runs,
     }
 
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_service(name_id_or_prefix: str) -> dict[str, Any]:
     """Get detailed information about a specific service.
 
@@ -1425,6 +2067,7 @@ def list_services(
     pipeline_run_id: str | None = None,
     pipeline_step_name: str | None = None,
     model_version_id: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all services in the ZenML workspace.
 
@@ -1448,6 +2091,8 @@ def list_services(
         pipeline_run_id: The ID of the pipeline run
         pipeline_step_name: The name of the pipeline step
         model_version_id: The ID of the model version
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     services = get_zenml_client().list_services(
         sort_by=sort_by,
@@ -1464,11 +2109,12 @@ def list_services(
         pipeline_step_name=pipeline_step_name,
         model_version_id=model_version_id,
     )
-    return services.model_dump(mode="json")
+    return _dump_page(services, verbose)
 
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_stack_component(name_id_or_prefix: str) -> dict[str, Any]:
     """Get detailed information about a specific stack component.
 
@@ -1491,6 +2137,8 @@ def list_stack_components(
     name: str | None = None,
     flavor: str | None = None,
     stack_id: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all stack components in the ZenML workspace.
 
@@ -1510,6 +2158,12 @@ def list_stack_components(
         name: Filter by component name (e.g. contains:s3)
         flavor: Filter by flavor name (e.g. contains:aws)
         stack_id: Filter by stack UUID
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["name", "type",
+            "flavor_name"] (matched inside body/metadata/resources; 'id' is
+            always kept; names that don't exist are listed in
+            'unknown_fields'). Omit to return full items
     """
     stack_components = get_zenml_client().list_stack_components(
         sort_by=sort_by,
@@ -1522,11 +2176,12 @@ def list_stack_components(
         flavor=flavor,
         stack_id=stack_id,
     )
-    return stack_components.model_dump(mode="json")
+    return _dump_page(stack_components, verbose, fields)
 
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_flavor(name_id_or_prefix: str) -> dict[str, Any]:
     """Get detailed information about a specific flavor.
 
@@ -1539,6 +2194,7 @@ def get_flavor(name_id_or_prefix: str) -> dict[str, Any]:
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup(ttl=300.0)
 def list_flavors(
     sort_by: str = "desc:created",
     page: int = 1,
@@ -1549,6 +2205,7 @@ def list_flavors(
     updated: str | None = None,
     name: str | None = None,
     integration: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all flavors in the ZenML workspace.
 
@@ -1565,6 +2222,8 @@ def list_flavors(
         id: Filter by flavor UUID
         created: Filter by creation time (e.g. gte:2026-02-01 00:00:00)
         updated: Filter by update time (same syntax as created)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     flavors = get_zenml_client().list_flavors(
         sort_by=sort_by,
@@ -1577,7 +2236,7 @@ def list_flavors(
         name=name,
         integration=integration,
     )
-    return flavors.model_dump(mode="json")
+    return _dump_page(flavors, verbose)
 
 
 @mcp.tool()
@@ -1643,6 +2302,8 @@ def trigger_pipeline(
         )
 
     pipeline_run = get_zenml_client().trigger_pipeline(**trigger_kwargs)
+    _lookup_cache.clear()
+    _clear_prefetched_pages()
     analytics.track_event(
         "Pipeline Triggered",
         {
@@ -1663,6 +2324,7 @@ def trigger_pipeline(
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_run_template(name_id_or_prefix: str) -> dict[str, Any]:
     """Get a run template for a pipeline.
 
@@ -1694,6 +2356,7 @@ def list_run_templates(
     updated: str | None = None,
     name: str | None = None,
     tag: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all run templates in the ZenML workspace.
 
@@ -1714,6 +2377,8 @@ def list_run_templates(
         updated: Filter by update time (same syntax as created)
         name: Filter by template name (e.g. contains:train)
         tag: Filter by tag name
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     run_templates = get_zenml_client().list_run_templates(
         sort_by=sort_by,
@@ -1730,7 +2395,7 @@ def list_run_templates(
             "Please use `list_snapshots` instead. For runnable configurations, "
             "use `list_snapshots(runnable=True)`. Run Templates will be removed in a future version."
         ),
-        "run_templates": run_templates.model_dump(mode="json"),
+        "run_templates": _dump_page(run_templates, verbose),
     }
 
 
@@ -1789,6 +2454,8 @@ def list_snapshots(
     tag: str | None = None,
     project: str | None = None,
     named_only: bool | None = True,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all snapshots in the ZenML workspace.
 
@@ -1816,6 +2483,12 @@ def list_snapshots(
         tag: Filter by tag name
         project: Project scope (defaults to active project)
         named_only: Only named snapshots (default True to skip internal ones)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["name", "runnable",
+            "created"] (matched inside body/metadata/resources; 'id' is always
+            kept; names that don't exist are listed in 'unknown_fields'). Omit
+            to return full items
     """
     snapshots = get_zenml_client().list_snapshots(
         sort_by=sort_by,
@@ -1833,7 +2506,7 @@ def list_snapshots(
         project=project,
         named_only=named_only,
     )
-    return snapshots.model_dump(mode="json")
+    return _dump_page(snapshots, verbose, fields)
 
 
 # =============================================================================
@@ -1882,6 +2555,8 @@ def list_deployments(
     snapshot_id: str | None = None,
     tag: str | None = None,
     project: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all deployments in the ZenML workspace.
 
@@ -1907,6 +2582,12 @@ def list_deployments(
         snapshot_id: Filter by source snapshot UUID
         tag: Filter by tag name
         project: Project scope (defaults to active project)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["name", "status",
+            "url"] (matched inside body/metadata/resources; 'id' is always
+            kept; names that don't exist are listed in 'unknown_fields'). Omit
+            to return full items
     """
     deployments = get_zenml_client().list_deployments(
         sort_by=sort_by,
@@ -1923,12 +2604,20 @@ def list_deployments(
         tag=tag,
         project=project,
     )
-    return deployments.model_dump(mode="json")
+    return _dump_page(deployments, verbose, fields)
 
 
 # Maximum size for deployment logs output (100KB)
 MAX_DEPLOYMENT_LOGS_SIZE = 100 * 1024
 
+# ZenML raises NotImplementedError both when a deployer can't be instantiated
+# because its integration requirements are missing and when the deployment no
+# longer has a deployer; these substrings tell the first case apart
+_DEPLOYER_DEPS_MISSING_MARKERS = (
+    "could not be instantiated",
+    "dependencies are not installed",
+)
+
 
 @mcp.tool()
 @handle_tool_exceptions
@@ -1971,7 +2660,9 @@ def get_deployment_logs(
         truncated = False
 
         for line in log_generator:
-            line_size = len(line.encode("utf-8"))
+            # ASCII fast path: for pure-ASCII lines the char count is the
+            # byte count, so skip allocating an encoded copy just to measure it
+            line_size = len(line) if line.isascii() else len(line.encode("utf-8"))
             if total_size + line_size > MAX_DEPLOYMENT_LOGS_SIZE:
                 truncated = True
                 break
@@ -1999,39 +2690,33 @@ def get_deployment_logs(
     except ImportError as e:
         # Handle missing deployer plugin (direct import failure)
         return {
-            "error": {
-                "tool": "get_deployment_logs",
-                "type": "deployer_plugin_not_installed",
-                "message": (
-                    f"The deployer plugin required to fetch logs is not installed: {e}. "
-                    "Please install the appropriate ZenML integration for your stack "
-                    "(e.g., `zenml integration install gcp` for GCP deployments), "
-                    "then restart the MCP server."
-                ),
-            },
+            **_make_error_result(
+                "get_deployment_logs",
+                f"The deployer plugin required to fetch logs is not installed: {e}. "
+                "Please install the appropriate ZenML integration for your stack "
+                "(e.g., `zenml integration install gcp` for GCP deployments), "
+                "then restart the MCP server.",
+                "deployer_plugin_not_installed",
+            ),
             "logs": None,
         }
-    except Exception as e:
-        # Check if this is a deployer instantiation error (missing dependencies)
+    except NotImplementedError as e:
+        # Check if this is a deployer instantiation error (missing dependencies).
+        # Anything else goes straight to the decorator without being stringified.
         error_str = str(e)
-        if (
-            "could not be instantiated" in error_str
-            or "dependencies are not installed" in error_str
-        ):
+        if any(marker in error_str for marker in _DEPLOYER_DEPS_MISSING_MARKERS):
             return {
-                "error": {
-                    "tool": "get_deployment_logs",
-                    "type": "deployer_dependencies_missing",
-                    "message": (
-                        f"The deployer's dependencies are not installed: {error_str}\n\n"
-                        "To fix this:\n"
-                        "1. Check which stack/deployer was used for this deployment\n"
-                        "2. Install the required ZenML integration for that deployer:\n"
-                        "   `zenml integration install <integration-name>`\n"
-                        "3. Restart the MCP server\n\n"
-                        "Common deployer integrations: gcp, aws, azure, kubernetes, huggingface"
-                    ),
-                },
+                **_make_error_result(
+                    "get_deployment_logs",
+                    f"The deployer's dependencies are not installed: {error_str}\n\n"
+                    "To fix this:\n"
+                    "1. Check which stack/deployer was used for this deployment\n"
+                    "2. Install the required ZenML integration for that deployer:\n"
+                    "   `zenml integration install <integration-name>`\n"
+                    "3. Restart the MCP server\n\n"
+                    "Common deployer integrations: gcp, aws, azure, kubernetes, huggingface",
+                    "deployer_dependencies_missing",
+                ),
                 "logs": None,
             }
         # Re-raise other exceptions to be handled by the decorator
@@ -2040,6 +2725,7 @@ def get_deployment_logs(
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_schedule(name_id_or_prefix: str) -> dict[str, Any]:
     """Get a schedule for a pipeline.
 
@@ -2063,6 +2749,7 @@ def list_schedules(
     pipeline_id: str | None = None,
     orchestrator_id: str | None = None,
     active: bool | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all schedules in the ZenML workspace.
 
@@ -2082,6 +2769,8 @@ def list_schedules(
         pipeline_id: Filter by pipeline UUID
         orchestrator_id: Filter by orchestrator UUID
         active: Filter by active status (True/False)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     schedules = get_zenml_client().list_schedules(
         sort_by=sort_by,
@@ -2095,7 +2784,7 @@ def list_schedules(
         orchestrator_id=orchestrator_id,
         active=active,
     )
-    return schedules.model_dump(mode="json")
+    return _dump_page(schedules, verbose)
 
 
 @mcp.tool()
@@ -2106,8 +2795,15 @@ def get_pipeline_run(name_id_or_prefix: str) -> dict[str, Any]:
     Args:
         name_id_or_prefix: The name, ID or prefix of the pipeline run to retrieve
     """
+    cache_key = ("get_pipeline_run", name_id_or_prefix)
+    cached = _finished_cache.get(cache_key)
+    if cached is not None:
+        return cached
     pipeline_run = get_zenml_client().get_pipeline_run(name_id_or_prefix)
-    return pipeline_run.model_dump(mode="json")
+    result = pipeline_run.model_dump(mode="json")
+    if pipeline_run.status.is_finished:
+        _finished_cache.set(cache_key, result)
+    return result
 
 
 @mcp.tool()
@@ -2128,12 +2824,19 @@ def list_pipeline_runs(
     end_time: str | None = None,
     stack: str | None = None,
     stack_component: str | None = None,
+    cursor: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all pipeline runs in the ZenML workspace.
 
     Returns paginated results with 'items', 'total', 'page', 'size' fields.
     The 'total' field gives the global count matching your filters — useful
     for answering 'how many runs?' without fetching all pages.
+    With the default sort_by, 'next_cursor' is also returned: pass it as
+    'cursor' to get the next page (null when there are no more). In a
+    response to a 'cursor' call, 'total' and 'total_pages' only count the
+    items not yet returned, not the full listing.
 
     Filter syntax: String params support 'op:value' operators (gte, lte, gt,
     lt, equals, notequals, contains, startswith, endswith, oneof, in).
@@ -2157,10 +2860,151 @@ def list_pipeline_runs(
         end_time: Filter by run end time (e.g. lte:2026-02-07 23:59:59)
         stack: Filter by stack name
         stack_component: Filter by stack component name
+        cursor: Continue from the 'next_cursor' of a previous response. Faster
+            than deep 'page' numbers; needs the default sort_by and no
+            'created' filter. 'page' is ignored when set
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["name", "status",
+            "created"] (matched inside body/metadata/resources; 'id' is always
+            kept; names that don't exist are listed in 'unknown_fields'). Omit
+            to return full items
     """
-    pipeline_runs = get_zenml_client().list_pipeline_runs(
+    client = get_zenml_client()
+    if cursor:
+        _check_cursor_args(sort_by, logical_operator, created)
+        before, skip_ids = _decode_list_cursor(cursor)
+        pipeline_runs = client.list_pipeline_runs(
+            sort_by=sort_by,
+            page=1,
+            size=size + len(skip_ids),
+            logical_operator=logical_operator,
+            created=f"lt:{before}",
+            updated=updated,
+            name=name,
+            pipeline_id=pipeline_id,
+            pipeline_name=pipeline_name,
+            stack_id=stack_id,
+            status=status,
+            start_time=start_time,
+            end_time=end_time,
+            stack=stack,
+            stack_component=stack_component,
+        )
+        pipeline_runs, next_cursor = _apply_list_cursor(
+            pipeline_runs, size, before, skip_ids
+        )
+        return {
+            **_dump_page(pipeline_runs, verbose, fields),
+            "next_cursor": next_cursor,
+        }
+
+    filters: dict[str, Any] = {
+        "sort_by": sort_by,
+        "size": size,
+        "logical_operator": logical_operator,
+        "created": created,
+        "updated": updated,
+        "name": name,
+        "pipeline_id": pipeline_id,
+        "pipeline_name": pipeline_name,
+        "stack_id": stack_id,
+        "status": status,
+        "start_time": start_time,
+        "end_time": end_time,
+        "stack": stack,
+        "stack_component": stack_component,
+    }
+    filters_key = ("list_pipeline_runs", tuple(sorted(filters.items())))
+
+    pipeline_runs = _prefetched_pages.pop((filters_key, page))
+    was_prefetched = pipeline_runs is not None
+    if pipeline_runs is None:
+        pipeline_runs = client.list_pipeline_runs(page=page, **filters)
+
+    if (
+        (page == 1 or was_prefetched)
+        and size <= _PREFETCH_MAX_PAGE_SIZE
+        and page < pipeline_runs.total_pages
+    ):
+        _prefetch_page(
+            (filters_key, page + 1),
+            functools.partial(client.list_pipeline_runs, page=page + 1, **filters),
+        )
+    if sort_by == _CURSOR_SORT_BY and logical_operator == "and" and not created:
+        _, next_cursor = _apply_list_cursor(pipeline_runs, size, None, [])
+        return {
+            **_dump_page(pipeline_runs, verbose, fields),
+            "next_cursor": next_cursor,
+        }
+    return _dump_page(pipeline_runs, verbose, fields)
+
+
+@mcp.tool()
+@handle_tool_exceptions
+def list_all_pipeline_runs(
+    sort_by: str = "desc:created",
+    size: int = 50,
+    max_pages: int = 5,
+    logical_operator: str = "and",
+    created: str | None = None,
+    updated: str | None = None,
+    name: str | None = None,
+    pipeline_id: str | None = None,
+    pipeline_name: str | None = None,
+    stack_id: str | None = None,
+    status: str | None = None,
+    start_time: str | None = None,
+    end_time: str | None = None,
+    stack: str | None = None,
+    stack_component: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """List pipeline runs across several pages in a single call.
+
+    Fetches up to 'max_pages' pages of runs concurrently and returns their
+    items combined. Prefer this over paging through list_pipeline_runs one
+    call at a time when you need more than one page (e.g. "all failed runs
+    this week"); use list_pipeline_runs for a quick look or when only the
+    'total' count matters. Pair with 'fields' to keep large results small.
+
+    Returns 'items', 'total' (global count matching your filters),
+    'total_pages', 'pages_fetched' and 'truncated' (True if more pages exist
+    beyond 'max_pages').
+
+    Filter syntax is the same as for list_pipeline_runs.
+
+    Args:
+        sort_by: Sort field and direction (e.g. desc:created, asc:start_time)
+        size: Results per page (at most 200)
+        max_pages: Maximum number of pages to fetch (at most 10)
+        logical_operator: Combine filters with 'and' or 'or'
+        created: Filter by creation time (e.g. gte:2026-02-01 00:00:00)
+        updated: Filter by update time (same syntax as created)
+        name: Filter by run name (e.g. contains:training)
+        pipeline_id: Filter by pipeline UUID
+        pipeline_name: Filter by pipeline name (e.g. contains:my_pipeline)
+        stack_id: Filter by stack UUID
+        status: Filter by run status (e.g. oneof:completed,failed).
+            Values: initializing, failed, completed, running, cached
+        start_time: Filter by run start time (e.g. gte:2026-02-01 00:00:00)
+        end_time: Filter by run end time (e.g. lte:2026-02-07 23:59:59)
+        stack: Filter by stack name
+        stack_component: Filter by stack component name
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["name", "status",
+            "created"] (matched inside body/metadata/resources; 'id' is always
+            kept; names that don't exist are listed in 'unknown_fields'). Omit
+            to return full items
+    """
+    size = min(max(size, 1), _MAX_LIST_PAGE_SIZE)
+    max_pages = min(max(max_pages, 1), _FETCH_ALL_MAX_PAGES)
+    pages = _fetch_all_pages(
+        get_zenml_client().list_pipeline_runs,
+        max_pages,
         sort_by=sort_by,
-        page=page,
         size=size,
         logical_operator=logical_operator,
         created=created,
@@ -2175,7 +3019,31 @@ def list_pipeline_runs(
         stack=stack,
         stack_component=stack_component,
     )
-    return pipeline_runs.model_dump(mode="json")
+
+    # Runs created while pages are being fetched shift later pages, so drop
+    # any run that was already returned on an earlier page
+    items: list[dict[str, Any]] = []
+    seen_ids: set[Any] = set()
+    unknown_fields: list[str] = []
+    for page in pages:
+        dumped = _dump_page(page, verbose, fields)
+        unknown_fields = dumped.get("unknown_fields", unknown_fields)
+        for item in dumped["items"]:
+            if item.get("id") not in seen_ids:
+                seen_ids.add(item.get("id"))
+                items.append(item)
+
+    last_page = pages[-1]
+    result = {
+        "items": items,
+        "total": last_page.total,
+        "total_pages": last_page.total_pages,
+        "pages_fetched": len(pages),
+        "truncated": len(pages) < last_page.total_pages,
+    }
+    if unknown_fields:
+        result["unknown_fields"] = unknown_fields
+    return result
 
 
 @mcp.tool()
@@ -2186,8 +3054,15 @@ def get_run_step(step_run_id: str) -> dict[str, Any]:
     Args:
         step_run_id: The ID of the run step to retrieve
     """
+    cache_key = ("get_run_step", step_run_id)
+    cached = _finished_cache.get(cache_key)
+    if cached is not None:
+        return cached
     run_step = get_zenml_client().get_run_step(step_run_id)
-    return run_step.model_dump(mode="json")
+    result = run_step.model_dump(mode="json")
+    if run_step.status.is_finished:
+        _finished_cache.set(cache_key, result)
+    return result
 
 
 @mcp.tool()
@@ -2204,11 +3079,18 @@ def list_run_steps(
     start_time: str | None = None,
     end_time: str | None = None,
     pipeline_run_id: str | None = None,
+    cursor: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all run steps in the ZenML workspace.
 
     Returns paginated results with 'items', 'total', 'page', 'size' fields.
-    The 'total' field gives the global count matching your filters.
+    The 'total' field gives the global count matching your filters. With the
+    default sort_by, 'next_cursor' is also returned: pass it as 'cursor' to
+    get the next page (null when there are no more). In a response to a
+    'cursor' call, 'total' and 'total_pages' only count the items not yet
+    returned, not the full listing.
 
     Filter syntax: String params support 'op:value' operators (gte, lte, gt,
     lt, equals, notequals, contains, startswith, endswith, oneof, in).
@@ -2227,13 +3109,28 @@ def list_run_steps(
         start_time: Filter by step start time (e.g. gte:2026-02-01 00:00:00)
         end_time: Filter by step end time (e.g. lte:2026-02-07 23:59:59)
         pipeline_run_id: Filter by pipeline run UUID
+        cursor: Continue from the 'next_cursor' of a previous response. Faster
+            than deep 'page' numbers; needs the default sort_by and no
+            'created' filter. 'page' is ignored when set
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["name", "status",
+            "start_time"] (matched inside body/metadata/resources; 'id' is
+            always kept; names that don't exist are listed in
+            'unknown_fields'). Omit to return full items
     """
+    before: str | None = None
+    skip_ids: list[str] = []
+    if cursor:
+        _check_cursor_args(sort_by, logical_operator, created)
+        before, skip_ids = _decode_list_cursor(cursor)
+        page = 1
     run_steps = get_zenml_client().list_run_steps(
         sort_by=sort_by,
         page=page,
-        size=size,
+        size=size + len(skip_ids),
         logical_operator=logical_operator,
-        created=created,
+        created=f"lt:{before}" if before else created,
         updated=updated,
         name=name,
         status=status,
@@ -2241,7 +3138,13 @@ def list_run_steps(
         end_time=end_time,
         pipeline_run_id=pipeline_run_id,
     )
-    return run_steps.model_dump(mode="json")
+    if cursor:
+        run_steps, next_cursor = _apply_list_cursor(run_steps, size, before, skip_ids)
+    elif sort_by == _CURSOR_SORT_BY and logical_operator == "and" and not created:
+        _, next_cursor = _apply_list_cursor(run_steps, size, None, [])
+    else:
+        return _dump_page(run_steps, verbose, fields)
+    return {**_dump_page(run_steps, verbose, fields), "next_cursor": next_cursor}
 
 
 @mcp.tool()
@@ -2255,6 +3158,7 @@ def list_artifacts(
     updated: str | None = None,
     name: str | None = None,
     tag: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all artifacts in the ZenML workspace.
 
@@ -2272,6 +3176,8 @@ def list_artifacts(
         created: Filter by creation time (e.g. gte:2026-02-01 00:00:00)
         updated: Filter by update time (same syntax as created)
         name: Filter by artifact name (e.g. contains:model)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     artifacts = get_zenml_client().list_artifacts(
         sort_by=sort_by,
@@ -2283,7 +3189,7 @@ def list_artifacts(
         name=name,
         tag=tag,
     )
-    return artifacts.model_dump(mode="json")
+    return _dump_page(artifacts, verbose)
 
 
 @mcp.tool()
@@ -2316,6 +3222,8 @@ def list_artifact_versions(
     created: str | None = None,
     updated: str | None = None,
     tag: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all versions of a specific artifact.
 
@@ -2334,6 +3242,12 @@ def list_artifact_versions(
         created: Filter by creation time (e.g. gte:2026-02-01 00:00:00)
         updated: Filter by update time (same syntax as created)
         tag: Filter by tag name
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["artifact", "version",
+            "type"] (matched inside body/metadata/resources; 'id' is always
+            kept; names that don't exist are listed in 'unknown_fields'). Omit
+            to return full items
     """
     versions = get_zenml_client().list_artifact_versions(
         artifact=artifact_name_or_id,
@@ -2345,7 +3259,7 @@ def list_artifact_versions(
         updated=updated,
         tag=tag,
     )
-    return versions.model_dump(mode="json")
+    return _dump_page(versions, verbose, fields)
 
 
 @mcp.tool()
@@ -2358,6 +3272,7 @@ def list_secrets(
     created: str | None = None,
     updated: str | None = None,
     name: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all secrets in the ZenML workspace (names only, no values).
 
@@ -2375,6 +3290,8 @@ def list_secrets(
         created: Filter by creation time (e.g. gte:2026-02-01 00:00:00)
         updated: Filter by update time (same syntax as created)
         name: Filter by secret name (e.g. contains:api)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     secrets = get_zenml_client().list_secrets(
         sort_by=sort_by,
@@ -2385,11 +3302,12 @@ def list_secrets(
         updated=updated,
         name=name,
     )
-    return secrets.model_dump(mode="json")
+    return _dump_page(secrets, verbose)
 
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_service_connector(name_id_or_prefix: str) -> dict[str, Any]:
     """Get a service connector by name, ID, or prefix.
 
@@ -2411,6 +3329,7 @@ def list_service_connectors(
     updated: str | None = None,
     name: str | None = None,
     connector_type: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all service connectors in the ZenML workspace.
 
@@ -2429,6 +3348,8 @@ def list_service_connectors(
         updated: Filter by update time (same syntax as created)
         name: Filter by connector name (e.g. contains:aws)
         connector_type: Filter by connector type (e.g. contains:gcp)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     service_connectors = get_zenml_client().list_service_connectors(
         sort_by=sort_by,
@@ -2440,11 +3361,12 @@ def list_service_connectors(
         name=name,
         connector_type=connector_type,
     )
-    return service_connectors.model_dump(mode="json")
+    return _dump_page(service_connectors, verbose)
 
 
 @mcp.tool()
 @handle_tool_exceptions
+@_memoize_lookup
 def get_model(name_id_or_prefix: str) -> dict[str, Any]:
     """Get a model by name, ID, or prefix.
 
@@ -2466,6 +3388,7 @@ def list_models(
     updated: str | None = None,
     name: str | None = None,
     tag: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all models in the ZenML workspace.
 
@@ -2484,6 +3407,8 @@ def list_models(
         updated: Filter by update time (same syntax as created)
         name: Filter by model name (e.g. contains:bert)
         tag: Filter by tag name (e.g. contains:prod)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     models = get_zenml_client().list_models(
         sort_by=sort_by,
@@ -2495,7 +3420,7 @@ def list_models(
         name=name,
         tag=tag,
     )
-    return models.model_dump(mode="json")
+    return _dump_page(models, verbose)
 
 
 @mcp.tool()
@@ -2531,6 +3456,8 @@ def list_model_versions(
     number: int | None = None,
     stage: str | None = None,
     tag: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all model versions for a model.
 
@@ -2552,6 +3479,12 @@ def list_model_versions(
         number: Filter by version number
         stage: Filter by stage (e.g. oneof:production,staging)
         tag: Filter by tag name
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["name", "stage",
+            "number"] (matched inside body/metadata/resources; 'id' is always
+            kept; names that don't exist are listed in 'unknown_fields'). Omit
+            to return full items
     """
     model_versions = get_zenml_client().list_model_versions(
         model_name_or_id,
@@ -2566,7 +3499,7 @@ def list_model_versions(
         stage=stage,
         tag=tag,
     )
-    return model_versions.model_dump(mode="json")
+    return _dump_page(model_versions, verbose, fields)
 
 
 @mcp.tool()
@@ -2579,8 +3512,14 @@ def get_step_code(
     Args:
         step_run_id: The ID of the step to retrieve
     """
-    step_code = get_zenml_client().get_run_step(step_run_id).source_code
-    return f"""{step_code}"""
+    # A step's source code is fixed when the step is created, so cache just
+    # the string rather than the whole step
+    cache_key = ("get_step_code", step_run_id)
+    step_code = _finished_cache.get(cache_key)
+    if step_code is None:
+        step_code = f"""{get_zenml_client().get_run_step(step_run_id).source_code}"""
+        _finished_cache.set(cache_key, step_code)
+    return step_code
 
 
 # =============================================================================
@@ -2616,6 +3555,7 @@ def list_tags(
     name: str | None = None,
     exclusive: bool | None = None,
     resource_type: str | None = None,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """List all tags in the ZenML workspace.
 
@@ -2638,6 +3578,8 @@ def list_tags(
         name: Filter by tag name (e.g. contains:prod)
         exclusive: If True, only return exclusive tags
         resource_type: Filter by resource type the tag applies to
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
     """
     tags = get_zenml_client().list_tags(
         sort_by=sort_by,
@@ -2650,7 +3592,7 @@ def list_tags(
         exclusive=exclusive,
         resource_type=resource_type,
     )
-    return tags.model_dump(mode="json")
+    return _dump_page(tags, verbose)
 
 
 # =============================================================================
@@ -2697,6 +3639,8 @@ def list_builds(
     is_local: bool | None = None,
     contains_code: bool | None = None,
     project: str | None = None,
+    verbose: bool = False,
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """List all pipeline builds in the ZenML workspace.
 
@@ -2721,6 +3665,12 @@ def list_builds(
         is_local: If True, only local builds (not runnable from server)
         contains_code: If True, only builds with embedded code
         project: Project scope (defaults to active project)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+        fields: Only return these fields per item, e.g. ["created", "user_id"]
+            (matched inside body/metadata/resources; 'id' is always kept; names
+            that don't exist are listed in 'unknown_fields'). Omit to return
+            full items
     """
     builds = get_zenml_client().list_builds(
         sort_by=sort_by,
@@ -2735,7 +3685,124 @@ def list_builds(
         contains_code=contains_code,
         project=project,
     )
-    return builds.model_dump(mode="json")
+    return _dump_page(builds, verbose, fields)
+
+
+# =============================================================================
+# Batch Tools
+# =============================================================================
+
+# Entity types get_many can batch-fetch, mapped to the Client.list_* method
+# whose 'id' filter accepts a 'oneof:' list of UUIDs
+_GET_MANY_LISTERS: dict[str, str] = {
+    "pipeline_run": "list_pipeline_runs",
+    "run_step": "list_run_steps",
+    "pipeline": "list_pipelines",
+    "artifact_version": "list_artifact_versions",
+    "stack": "list_stacks",
+    "stack_component": "list_stack_components",
+    "model": "list_models",
+    "model_version": "list_model_versions",
+    "snapshot": "list_snapshots",
+    "deployment": "list_deployments",
+    "schedule": "list_schedules",
+    "service": "list_services",
+    "build": "list_builds",
+}
+
+# Stacks and stack components are workspace-wide; every other entity lives in
+# a project, and ZenML's list calls default to the active one
+_GET_MANY_UNSCOPED = {"stack", "stack_component"}
+
+GetManyEntity = Literal[
+    "pipeline_run",
+    "run_step",
+    "pipeline",
+    "artifact_version",
+    "stack",
+    "stack_component",
+    "model",
+    "model_version",
+    "snapshot",
+    "deployment",
+    "schedule",
+    "service",
+    "build",
+]
+
+
+@mcp.tool()
+@handle_tool_exceptions
+def get_many(
+    entity: GetManyEntity,
+    ids: list[str],
+    project: str | None = None,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Fetch several entities of one type by ID in a single request.
+
+    Prefer this over calling get_<entity> in a loop when you already know the
+    IDs (e.g. step IDs from a run, or run IDs from a listing): it makes one
+    round-trip to the ZenML server instead of one per ID. For example, to
+    check the status of three runs from an earlier listing:
+    get_many(entity="pipeline_run", ids=[run_a_id, run_b_id, run_c_id]).
+    For IDs of different entity types, make one get_many call per type.
+
+    Returns a page with 'items' (in no particular order) plus 'missing_ids'
+    for any requested ID that was not found. Project-scoped entities (all but
+    stack and stack_component) are only looked up in one project, the active
+    one unless 'project' is given, so an ID from another project is reported
+    as missing too.
+
+    Args:
+        entity: Entity type to fetch (e.g. pipeline_run, run_step, stack)
+        ids: Full UUIDs of the entities to fetch (at most 200)
+        project: Project to look the entities up in (defaults to the active
+            project; ignored for stack and stack_component)
+        verbose: Include fields whose value is null (omitted by default to
+            keep responses small)
+    """
+    if entity not in _GET_MANY_LISTERS:
+        return _make_error_result(
+            "get_many",
+            f"Unknown entity type {entity!r}. Use one of: "
+            f"{', '.join(_GET_MANY_LISTERS)}.",
+            "ValidationError",
+        )
+    try:
+        unique_ids = list(dict.fromkeys(str(UUID(i)) for i in ids))
+    except ValueError:
+        return _make_error_result(
+            "get_many",
+            "All ids must be full UUIDs. Use the matching get_<entity> tool "
+            "to look up entities by name or ID prefix.",
+            "ValidationError",
+        )
+    if len(unique_ids) > _MAX_LIST_PAGE_SIZE:
+        return _make_error_result(
+            "get_many",
+            f"At most {_MAX_LIST_PAGE_SIZE} ids can be fetched per call.",
+            "ValidationError",
+        )
+    if not unique_ids:
+        return {"items": [], "total": 0, "missing_ids": []}
+
+    list_method = getattr(get_zenml_client(), _GET_MANY_LISTERS[entity])
+    list_kwargs: dict[str, Any] = {
+        "id": f"oneof:{json.dumps(unique_ids)}",
+        "size": len(unique_ids),
+    }
+    if entity not in _GET_MANY_UNSCOPED:
+        list_kwargs["project"] = project
+    if entity == "snapshot":
+        # Unnamed snapshots are hidden by default but can be fetched by ID
+        list_kwargs["named_only"] = False
+    page = list_method(**list_kwargs)
+
+    found = {str(item.id) for item in page.items}
+    result = _dump_page(page, verbose)
+    result["missing_ids"] = [i for i in unique_ids if i not in found]
+    return result
 
 
 @mcp.prompt()
@@ -2865,6 +3932,12 @@ def open_run_activity_chart() -> str:
     )
 
 
+# Rendered most_recent_runs payloads keyed by run_count. Clients re-read this
+# resource far more often than new runs appear, so a few seconds of staleness
+# turns repeated reads into a dict lookup.
+_recent_runs_cache = _TTLCache(maxsize=16, ttl=3.0)
+
+
 @mcp.resource(uri="resource://zenml_server/most_recent_runs?run_count={run_count}")
 @handle_exceptions
 def most_recent_runs(run_count: int = 10) -> str:
@@ -2873,15 +3946,21 @@ def most_recent_runs(run_count: int = 10) -> str:
     Args:
         run_count: The number of runs to return
     """
-    return (
+    cached = _recent_runs_cache.get(run_count)
+    if cached is not None:
+        return cached
+    runs_json = (
         get_zenml_client()
         .list_pipeline_runs(
             sort_by="desc:created",
             page=1,
             size=run_count,
         )
-        .model_dump_json()
+        # Same compact shape as the list tools: unset (null) fields omitted
+        .model_dump_json(exclude_none=True)
     )
+    _recent_runs_cache.set(run_count, runs_json)
+    return runs_json
 
 
 if __name__ == "__main__":